@@ -1,8 +1,10 @@
 from enum import Enum
+from typing import ClassVar
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_validator
 from common.services.firebase.firebase_object import FirebaseObject
 from common.models.domain.gift import GiftType
+from common.models.domain.enum_parsing import parse_enum
 
 class CaseOpeningStatus(str, Enum):
     NEW = "NEW"
@@ -10,15 +12,13 @@ class CaseOpeningStatus(str, Enum):
     INVENTORY = "INVENTORY"
 
 class Case(FirebaseObject):
+    COLLECTION: ClassVar[str] = "cases"  # Firestore collection for Case instances
+
     name: str
     cost: int
     image_url: str
     is_active: bool
     
-    @staticmethod
-    def collection_name():
-        return "cases"  # Firestore collection for User instances
-    
     @property
     def costf(self) -> float:
         """
@@ -28,6 +28,8 @@ class Case(FirebaseObject):
         return self.cost / 100.0 if self.cost else 0.0
     
 class CaseOpening(FirebaseObject):
+    COLLECTION: ClassVar[str] = "case_openings"  # Firestore collection for CaseOpening instances
+
     user_id: str
     case_id: str
     gift_id: str
@@ -36,6 +38,14 @@ class CaseOpening(FirebaseObject):
     status: CaseOpeningStatus
     open_at: datetime
 
+    @field_validator('gift_type', mode='before')
+    def _parse_gift_type(cls, v):
+        return parse_enum(GiftType, v)
+
+    @field_validator('status', mode='before')
+    def _parse_status(cls, v):
+        return parse_enum(CaseOpeningStatus, v)
+
     @property
     def gift_volumef(self) -> float:
         """
@@ -43,11 +53,9 @@ class CaseOpening(FirebaseObject):
         """
         return self.gift_volume / 100.0 if self.gift_volume else 0.0
 
-    @staticmethod
-    def collection_name():
-        return "case_openings"  # Firestore collection for User instances
-
 class CaseInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     cost: int
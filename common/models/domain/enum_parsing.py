@@ -0,0 +1,21 @@
+from enum import Enum
+from typing import Any, Type, TypeVar
+
+E = TypeVar("E", bound=Enum)
+
+def parse_enum(enum_cls: Type[E], v: Any) -> E:
+    """
+    Convert a stored value into an `enum_cls` member with a direct dict lookup,
+    bypassing Enum.__call__. Also accepts legacy "EnumName.VALUE" strings.
+    :raise ValueError: If the value is not a member of `enum_cls`.
+    """
+    if isinstance(v, enum_cls):
+        return v
+    if isinstance(v, str):
+        members = enum_cls._value2member_map_
+        member = members.get(v)
+        if member is None:
+            member = members.get(v.rsplit(".", 1)[-1])
+        if member is not None:
+            return member
+    raise ValueError(f"Invalid {enum_cls.__name__} value: {v!r}")
@@ -1,7 +1,9 @@
 from enum import Enum
-from typing import Optional, List
-from pydantic import BaseModel
+from operator import attrgetter
+from typing import ClassVar, Annotated, Any, Literal, Optional, List, Tuple, Union
+from pydantic import BaseModel, Discriminator, PrivateAttr, Tag, field_validator
 from common.services.firebase.firebase_object import FirebaseObject
+from common.models.domain.enum_parsing import parse_enum
 
 class GiftType(str, Enum):
     PORTALS_GIFT = "PORTALS_GIFT"
@@ -13,6 +15,7 @@ class Attribute(BaseModel):
     rarity_per_mille: float
 
 class PortalsNFT(BaseModel):
+    kind: Literal["portals_nft"] = "portals_nft"  # Payload discriminator
     id: str
     tg_id: str
     collection_id: str
@@ -30,20 +33,72 @@ class PortalsNFT(BaseModel):
     unlocks_at: Optional[str] = None
     is_owned: Optional[bool] = None
 
-    @property
-    def pricef(self) -> float:
+    # (`price` string, its parsed value), reparsed whenever `price` is replaced
+    _price_cache: Optional[Tuple[Optional[str], float]] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        self.__pydantic_fields_set__.add("kind")  # Always persist the discriminator
+
+    @staticmethod
+    def _parse_price(price: Optional[str]) -> float:
         try:
-            return float(self.price) if self.price is not None else 0.0
+            return float(price) if price is not None else 0.0
         except ValueError:
             return 0.0
+
+    @property
+    def pricef(self) -> float:
+        cache = self._price_cache
+        if cache is None or cache[0] is not self.price:
+            cache = self._price_cache = (self.price, self._parse_price(self.price))
+        return cache[1]
+
+    @property
+    def price_cents(self) -> int:
+        """
+        Price in cents (0 if the price is missing or invalid).
+        """
+        return int(self.pricef * 100)
         
 class TONReward(BaseModel):
+    kind: Literal["ton_reward"] = "ton_reward"  # Payload discriminator
     id: str
     name: str
     volume: int
     photo_url: str
 
+    def model_post_init(self, __context: Any) -> None:
+        self.__pydantic_fields_set__.add("kind")  # Always persist the discriminator
+
+def _payload_kind(v: Any) -> Optional[str]:
+    """
+    Pick the payload model by its `kind` tag instead of trying each one in turn.
+    """
+    if isinstance(v, dict):
+        kind = v.get("kind")
+        if kind is None:
+            # Payloads stored before the discriminator was added
+            kind = "portals_nft" if "tg_id" in v else "ton_reward"
+        return kind
+    return getattr(v, "kind", None)
+
+GiftPayload = Annotated[
+    Union[
+        Annotated[PortalsNFT, Tag("portals_nft")],
+        Annotated[TONReward, Tag("ton_reward")],
+    ],
+    Discriminator(_payload_kind),
+]
+
+# Payload type -> getter of the gift volume (in cents) it carries
+_PAYLOAD_VOLUME = {
+    PortalsNFT: attrgetter("price_cents"),
+    TONReward: attrgetter("volume"),
+}
+
 class Gift(FirebaseObject):
+    COLLECTION: ClassVar[str] = "gifts"  # Firestore collection for Gift instances
+
     case_id: str
     name: str
     prob: int
@@ -51,7 +106,11 @@ class Gift(FirebaseObject):
     is_active: bool
     type: GiftType
 
-    payload: PortalsNFT | TONReward = None
+    payload: Optional[GiftPayload] = None
+
+    @field_validator('type', mode='before')
+    def _parse_type(cls, v):
+        return parse_enum(GiftType, v)
 
     @property
     def probf(self) -> float:
@@ -74,16 +133,9 @@ class Gift(FirebaseObject):
         Update the payload of the gift.
         :param payload: The new payload to set.
         """
-        if isinstance(payload, (PortalsNFT)):
-            self.volume = int(float(payload.price) * 100)
-            self.payload = payload
-            
-        elif isinstance(payload, TONReward):
-            self.volume = payload.volume
-            self.payload = payload
-        else:
+        volume = _PAYLOAD_VOLUME.get(type(payload))
+        if volume is None:
             raise ValueError("Payload must be an instance of PortalsNFT or TONReward.")
-    
-    @staticmethod
-    def collection_name():
-        return "gifts"  # Firestore collection for User instances
\ No newline at end of file
+
+        self.volume = volume(payload)
+        self.payload = payload
\ No newline at end of file
@@ -1,11 +1,10 @@
+from typing import ClassVar
 from common.services.firebase.firebase_object import FirebaseObject
 
 class Inventory(FirebaseObject):
+    COLLECTION: ClassVar[str] = "inventory"  # Firestore collection for Inventory instances
+
     user_id: str
     gift_id: str
     volume_fixation: int
-    created_at: str
-    
-    @staticmethod
-    def collection_name():
-        return "inventory"  # Firestore collection for User instances
\ No newline at end of file
+    created_at: str
\ No newline at end of file
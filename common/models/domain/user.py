@@ -1,8 +1,10 @@
-from typing import Optional
+from typing import ClassVar, Optional
 from datetime import datetime
 from common.services.firebase.firebase_object import FirebaseObject
 
 class UserInfo(FirebaseObject):
+    COLLECTION: ClassVar[str] = "users"  # Firestore collection for UserInfo instances
+
     tg_id: int
     username: str
     first_name: str
@@ -17,15 +19,9 @@ class UserInfo(FirebaseObject):
     chat_instance: str
     signature: str
     referral_id: str = ""  # Optional field for referral ID (The user who referred this user)
-
-    @staticmethod
-    def collection_name():
-        return "users"  # Firestore collection for User instances
     
 class LaunchInfo(FirebaseObject):
-    launch_date: datetime
-    tgWebAppPlatform: str
+    COLLECTION: ClassVar[str] = "launch_info"  # Firestore collection for LaunchInfo instances
 
-    @staticmethod
-    def collection_name():
-        return "launch_info"  # Firestore collection for LaunchInfo instances
\ No newline at end of file
+    launch_date: datetime
+    tgWebAppPlatform: str
\ No newline at end of file
@@ -1,8 +1,9 @@
 from enum import Enum
-from typing import Optional, Dict, Any
-from datetime import datetime
-from pydantic import BaseModel, field_validator
+from typing import ClassVar, Optional, Dict, Any
+from datetime import datetime, timezone
+from pydantic import BaseModel, Field, field_serializer, field_validator
 from common.services.firebase.firebase_object import FirebaseObject
+from common.models.domain.enum_parsing import parse_enum
 
 class Currency(str, Enum):
     TON = "TON"
@@ -16,45 +17,48 @@ class TopUpStatus(str, Enum):
     FAILED = "FAILED"
 
 class Wallet(FirebaseObject):
+    COLLECTION: ClassVar[str] = "wallets"  # Firestore collection for Wallet instances
+
     user_id: str
     balance: int = 0
     currency: Currency
     last_updated: Optional[datetime] = None  # Timestamp of the last update
-
-    @staticmethod
-    def collection_name():
-        return "wallets"
     
     @field_validator('currency', mode='before')
-    def _normalize_currency(cls, v):
+    def _parse_currency(cls, v):
         """
-        Если из Firestore пришло "Currency.COIN", обрезаем префикс.
-        Иначе передаём значение дальше (Pydantic сам сконвертирует
-        строку 'COIN' в Currency.COIN).
+        Принимает Currency, "COIN" или старый формат "Currency.COIN" из Firestore.
         """
-        if isinstance(v, str) and v.startswith(f"{Currency.__name__}."):
-            return v.split(".", 1)[1]
-        return v
+        return parse_enum(Currency, v)
+
+    @field_serializer('currency')
+    def _serialize_currency(self, v: Currency) -> str:
+        return v.value
 
 class Transaction(FirebaseObject):
+    COLLECTION: ClassVar[str] = "transactions"  # Firestore collection for Transaction instances
+
     from_wallet_id: str  # ID of the wallet initiating the transaction
     to_wallet_id: str  # ID of the wallet receiving the transaction
     amount: int # Amount of the transaction in cents
     currency: Currency  # Currency of the transaction
-    timestamp: datetime = datetime.now()  # Timestamp of the transaction
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))  # Timestamp of the transaction
     description: str  # Description of the transaction
 
-    @staticmethod
-    def collection_name():
-        return "transactions"
+    def model_post_init(self, __context: Any) -> None:
+        self.__pydantic_fields_set__.add("timestamp")  # Always persist the timestamp
     
     @field_validator('currency', mode='before')
-    def _normalize_currency(cls, v):
-        if isinstance(v, str) and v.startswith(f"{Currency.__name__}."):
-            return v.split(".", 1)[1]
-        return v
+    def _parse_currency(cls, v):
+        return parse_enum(Currency, v)
+
+    @field_serializer('currency')
+    def _serialize_currency(self, v: Currency) -> str:
+        return v.value
 
 class TopUpRequest(FirebaseObject):
+    COLLECTION: ClassVar[str] = "topup_requests"  # Firestore collection for TopUpRequest instances
+
     user_id: str
     amount: int # In cents
     provider: str
@@ -63,8 +67,15 @@ class TopUpRequest(FirebaseObject):
     status: TopUpStatus
     payload: Optional[str] = None
     info: Optional[Dict[str, Any]] = None
-    created_at: datetime = datetime.now()
+    created_at: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
+
+    def model_post_init(self, __context: Any) -> None:
+        self.__pydantic_fields_set__.add("created_at")  # Always persist the creation time
+
+    @field_validator('currency', mode='before')
+    def _parse_currency(cls, v):
+        return parse_enum(Currency, v)
 
-    @staticmethod
-    def collection_name():
-        return "topup_requests"
\ No newline at end of file
+    @field_serializer('currency')
+    def _serialize_currency(self, v: Currency) -> str:
+        return v.value
@@ -0,0 +1,312 @@
+import json
+import asyncio
+import inspect
+import firebase_admin
+from typing import List, Type, Optional, Tuple
+from firebase_admin import credentials, firestore_async
+from google.api_core.retry_async import AsyncRetry
+from google.cloud.firestore_v1.async_batch import AsyncWriteBatch
+from google.cloud.firestore_v1.base_query import FieldFilter
+from common.services.firebase.firebase_service import COMMIT_RETRY_PARAMS, MAX_BATCH_SIZE, apply_filters
+from common.services.firebase.firebase_service_exception import FirebaseServiceException
+from common.services.firebase.firebase_object import FirebaseObject
+
+_COMMIT_RETRY = AsyncRetry(**COMMIT_RETRY_PARAMS)
+
+# Async Firebase service implementation, lets callers run independent requests concurrently
+class AsyncFirebaseService:
+    def __init__(self, api_key: str, max_workers: int = 10):
+        self.db = None
+        self.max_workers = max_workers  # Max concurrent batch commits
+        self.__initialize(api_key=api_key)
+
+    def __initialize(self, api_key: str):
+        """
+        Initialize Firebase Admin SDK with the service account key from the environment.
+        """
+
+        if not firebase_admin._apps:  # Check if Firebase app is already initialized
+            # If you're using the raw JSON string, load it as a dictionary
+            cred_dict = json.loads(api_key)
+            cred = credentials.Certificate(cred_dict)
+            firebase_admin.initialize_app(cred)
+
+        # Initialize async Firestore client
+        self.db = firestore_async.client()
+
+    async def add(self, obj: FirebaseObject) -> FirebaseObject:
+        """
+        Add an object to its Firestore collection.
+
+        :param obj: The object to be added to Firestore.
+        :return: The object with the assigned document ID.
+        """
+        try:
+            collection_ref = self.db.collection(obj.COLLECTION)
+            _, doc_ref = await collection_ref.add(obj.dump_for_write())
+            obj.id = doc_ref.id
+            return obj
+        except Exception as e:
+            raise FirebaseServiceException(f"Failed to add document to {obj.COLLECTION}: {str(e)}")
+
+    async def add_with_doc_id(self, doc_id: str, obj: FirebaseObject) -> FirebaseObject:
+        """
+        Add an object to its Firestore collection with specific document ID.
+
+        :param doc_id: The document ID to write to.
+        :param obj: The object to be added to Firestore.
+        :return: The object.
+        """
+        try:
+            doc_ref = self.db.collection(obj.COLLECTION).document(doc_id)
+            await doc_ref.set(obj.dump_for_write())
+            return obj
+        except Exception as e:
+            raise FirebaseServiceException(f"Failed to add document to {obj.COLLECTION}: {str(e)}")
+
+    async def delete(self, model_class: Type[FirebaseObject], document_id: str):
+        """
+        Delete an object by its document ID.
+
+        :param model_class: The class corresponding to the collection where the document resides.
+        :param document_id: The document ID of the object to delete.
+        """
+        try:
+            await self.db.collection(model_class.COLLECTION).document(document_id).delete()
+        except Exception as e:
+            raise FirebaseServiceException(f"Failed to delete document: {str(e)}")
+
+    async def fetch_all(
+        self,
+        model_class: Type[FirebaseObject],
+        filters: Optional[List[FieldFilter]] = None,
+        limit: Optional[int] = None
+    ) -> List[FirebaseObject]:
+        """
+        Fetch all documents from a Firestore collection and convert them into objects of type `model_class`.
+
+        :param model_class: The class to which the documents should be mapped (e.g., User, Product).
+        :param filters: Optional list of filters to apply to the query.
+        :param limit: Optional maximum number of documents to fetch (applied on the server).
+        :return: A list of objects of type `model_class`.
+        """
+        try:
+            query = apply_filters(self.db.collection(model_class.COLLECTION), filters)
+            if limit is not None:
+                query = query.limit(limit)
+
+            return [
+                model_class.model_validate({**doc.to_dict(), "id": doc.id})
+                async for doc in query.stream()
+            ]
+        except Exception as e:
+            raise FirebaseServiceException(f"Error fetching documents from {model_class.COLLECTION}: {str(e)}")
+
+    async def fetch_by_id(self, model_class: Type[FirebaseObject], doc_id: str) -> Optional[FirebaseObject]:
+        """
+        Fetch a single document by its ID and convert it into an object of the specified model class.
+
+        :param model_class: The class to which the document should be mapped (e.g., User).
+        :param doc_id: Document ID of the Firestore document to retrieve.
+        :return: An object of type `model_class` or None if the document does not exist.
+        """
+        try:
+            doc = await self.db.collection(model_class.COLLECTION).document(doc_id).get()
+            if not doc.exists:
+                return None
+            return model_class.model_validate({**doc.to_dict(), "id": doc.id})
+        except Exception as e:
+            raise FirebaseServiceException(f"Error fetching document from {model_class.COLLECTION}: {e}")
+
+    async def fetch_many(self, model_class: Type[FirebaseObject], doc_ids: List[str]) -> List[Optional[FirebaseObject]]:
+        """
+        Fetch multiple documents of one collection by their IDs in a single round-trip.
+
+        :param model_class: The class to which the documents should be mapped (e.g., User).
+        :param doc_ids: Document IDs of the Firestore documents to retrieve.
+        :return: A list of objects of type `model_class` in the order of `doc_ids`,
+                 with None for documents that do not exist.
+        """
+        if not doc_ids:
+            return []
+
+        try:
+            collection_ref = self.db.collection(model_class.COLLECTION)
+            refs = [collection_ref.document(doc_id) for doc_id in dict.fromkeys(doc_ids)]
+
+            # get_all streams the snapshots back in arbitrary order
+            found = {}
+            async for doc in self.db.get_all(refs):
+                if doc.exists:
+                    found[doc.id] = model_class.model_validate({**doc.to_dict(), "id": doc.id})
+
+            return [found.get(doc_id) for doc_id in doc_ids]
+        except Exception as e:
+            raise FirebaseServiceException(f"Error fetching documents from {model_class.COLLECTION}: {e}")
+
+    async def fetch_many_parallel(self, specs: List[Tuple[Type[FirebaseObject], str]]) -> List[Optional[FirebaseObject]]:
+        """
+        Fetch documents from different collections concurrently.
+
+        :param specs: List of (model_class, doc_id) pairs.
+        :return: A list of objects (or None for missing documents) in the order of `specs`.
+        """
+        return await asyncio.gather(*[self.fetch_by_id(model_class, doc_id) for model_class, doc_id in specs])
+
+    async def fetch_one(self, model_class: Type[FirebaseObject], filters: Optional[List[FieldFilter]]) -> Optional[FirebaseObject]:
+        """
+        Fetch a single document matching the filters.
+
+        :param model_class: The class to which the document should be mapped (e.g., User, Product).
+        :param filters: Optional list of filters to apply to the query.
+        :return: An object of type `model_class` or None if no document matches the query.
+        """
+        try:
+            query = apply_filters(self.db.collection(model_class.COLLECTION), filters)
+
+            # Two documents are enough to detect an ambiguous match
+            documents = [doc async for doc in query.limit(2).stream()]
+        except Exception as e:
+            raise FirebaseServiceException(f"Error fetching documents from {model_class.COLLECTION}: {str(e)}")
+
+        if not documents:
+            return None
+
+        if len(documents) != 1:
+            raise FirebaseServiceException(f"Expected one document, but found more in {model_class.COLLECTION}.")
+
+        return model_class.model_validate({**documents[0].to_dict(), "id": documents[0].id})
+
+    async def update(self, id: str, obj: FirebaseObject) -> dict:
+        """
+        Update an existing document by its ID, merging only the fields that were set.
+
+        :param id: The ID of the document to update.
+        :param obj: The object to update the document with.
+        :return: The written data including the document ID.
+        """
+        try:
+            data = obj.dump_for_write()
+            await self.db.collection(obj.COLLECTION).document(id).set(data, merge=True)
+            data["id"] = id
+            return data
+        except Exception as e:
+            raise FirebaseServiceException(f"Error updating document with ID {id}: {str(e)}")
+
+    async def add_to_subcollection(
+        self,
+        parent_collection: Type[FirebaseObject],
+        parent_id: str,
+        obj: FirebaseObject
+    ) -> str:
+        """
+        Add an object to a subcollection of a parent document in Firestore.
+
+        :param parent_collection: The parent collection class where the subcollection exists.
+        :param parent_id: The ID of the parent document.
+        :param obj: The object to be added to the subcollection.
+        :return: The document ID of the added object in the subcollection.
+        """
+        try:
+            parent_ref = self.db.collection(parent_collection.COLLECTION).document(parent_id)
+            _, doc_ref = await parent_ref.collection(obj.COLLECTION).add(obj.dump_for_write())
+            return doc_ref.id
+        except Exception as e:
+            raise FirebaseServiceException(
+                f"Adding subcollection failure {obj.COLLECTION} "
+                f"document {parent_collection.COLLECTION}/{parent_id}: {e}"
+            )
+
+    async def _commit_batches(self, batches: List[AsyncWriteBatch]) -> None:
+        """
+        Commit write batches concurrently (at most `max_workers` at a time),
+        retrying transient failures.
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def commit(batch: AsyncWriteBatch):
+            async with semaphore:
+                await batch.commit(retry=_COMMIT_RETRY)
+
+        await asyncio.gather(*[commit(batch) for batch in batches])
+
+    async def batch_add(self, objs: List[FirebaseObject]) -> List[FirebaseObject]:
+        """
+        Add multiple objects in chunks of MAX_BATCH_SIZE committed concurrently.
+
+        :param objs: List of FirebaseObject instances to add.
+        :return: List of FirebaseObject instances with assigned document IDs.
+        """
+        try:
+            batches = []
+            collection_refs = {}  # Reuse one CollectionReference per collection
+            for i in range(0, len(objs), MAX_BATCH_SIZE):
+                batch = self.db.batch()
+                for obj in objs[i:i + MAX_BATCH_SIZE]:
+                    collection_name = obj.COLLECTION
+                    collection_ref = collection_refs.get(collection_name)
+                    if collection_ref is None:
+                        collection_ref = collection_refs[collection_name] = self.db.collection(collection_name)
+                    doc_ref = collection_ref.document()  # auto-generated ID
+                    batch.set(doc_ref, obj.dump_for_write())
+                    obj.id = doc_ref.id
+                batches.append(batch)
+            await self._commit_batches(batches)
+            return objs
+        except Exception as e:
+            raise FirebaseServiceException(f"Batch add failed: {str(e)}")
+
+    async def batch_update(self, objs: List[FirebaseObject]) -> List[FirebaseObject]:
+        """
+        Update multiple documents in chunks of MAX_BATCH_SIZE committed concurrently.
+        Each object must have an 'id' field set.
+
+        :param objs: List of FirebaseObject instances to update.
+        :return: List of updated FirebaseObject instances.
+        """
+        try:
+            batches = []
+            collection_refs = {}  # Reuse one CollectionReference per collection
+            for i in range(0, len(objs), MAX_BATCH_SIZE):
+                batch = self.db.batch()
+                for obj in objs[i:i + MAX_BATCH_SIZE]:
+                    if not obj.id:
+                        raise FirebaseServiceException("Each object must have an ID for batch update.")
+                    collection_name = obj.COLLECTION
+                    collection_ref = collection_refs.get(collection_name)
+                    if collection_ref is None:
+                        collection_ref = collection_refs[collection_name] = self.db.collection(collection_name)
+                    batch.set(collection_ref.document(obj.id), obj.dump_for_write(), merge=True)
+                batches.append(batch)
+            await self._commit_batches(batches)
+            return objs
+        except Exception as e:
+            raise FirebaseServiceException(f"Batch update failed: {str(e)}")
+
+    async def batch_delete(self, model_class: Type[FirebaseObject], doc_ids: List[str]) -> None:
+        """
+        Delete multiple documents in chunks of MAX_BATCH_SIZE committed concurrently.
+
+        :param model_class: The class corresponding to the collection where documents are located.
+        :param doc_ids: List of document IDs to be deleted.
+        """
+        try:
+            batches = []
+            collection_ref = self.db.collection(model_class.COLLECTION)
+            for i in range(0, len(doc_ids), MAX_BATCH_SIZE):
+                batch = self.db.batch()
+                for doc_id in doc_ids[i:i + MAX_BATCH_SIZE]:
+                    batch.delete(collection_ref.document(doc_id))
+                batches.append(batch)
+            await self._commit_batches(batches)
+        except Exception as e:
+            raise FirebaseServiceException(f"Batch delete failed: {str(e)}")
+
+    async def close_db(self):
+        """
+        Close the Firestore database connection.
+        """
+        # Depending on the SDK version close() is either sync or a coroutine
+        result = self.db.close()
+        if inspect.isawaitable(result):
+            await result
@@ -1,12 +1,28 @@
-from abc import ABC, abstractmethod
+import inspect
+from abc import ABC
 from pydantic import BaseModel
-from typing import Optional
+from typing import Any, ClassVar, Dict, Optional
 
 # Abstract base class for Firebase object
 class FirebaseObject(ABC, BaseModel):
+    COLLECTION: ClassVar[str]  # Firestore collection name, declared by every subclass
+
     id: Optional[str] = None
     
-    @staticmethod
-    @abstractmethod
-    def collection_name():
-        pass
\ No newline at end of file
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # Fail at class definition rather than at the first service call
+        if not inspect.isabstract(cls) and not isinstance(getattr(cls, "COLLECTION", None), str):
+            raise TypeError(f"{cls.__name__} must declare COLLECTION: ClassVar[str]")
+
+    @classmethod
+    def collection_name(cls) -> str:
+        return cls.COLLECTION
+
+    def dump_for_write(self) -> Dict[str, Any]:
+        """
+        Serialize the explicitly set fields for a Firestore write.
+        :return: A new dictionary with the document data.
+        """
+        return self.__pydantic_serializer__.to_python(self, exclude_unset=True, by_alias=False)
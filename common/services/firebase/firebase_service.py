@@ -1,19 +1,99 @@
 import json
+import logging
+import itertools
 import firebase_admin
-from typing import List, Type, Optional
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, RLock, Thread
+from typing import Dict, Iterable, Iterator, List, Type, Optional
+from cachetools import TTLCache
 from firebase_admin import credentials, firestore
-from google.cloud.firestore_v1.base_query import FieldFilter
+from google.api_core import exceptions as google_exceptions
+from google.api_core.retry import Retry, if_exception_type
+from google.cloud import firestore as google_firestore
+from google.cloud.firestore_v1.base_query import And, FieldFilter
+from google.cloud.firestore_v1.batch import WriteBatch
 from common.services.firebase.firebase_service_exception import FirebaseServiceException
 from common.services.firebase.firebase_service_interface import FirebaseServiceInterface
 from common.services.firebase.firebase_object import FirebaseObject
 
+# Firestore rejects write batches with more than 500 operations
+MAX_BATCH_SIZE = 500
+
+logger = logging.getLogger(__name__)
+
+# How long invalidations are remembered to reject cache fills from reads
+# that were already in flight when the document was written
+_INVALIDATION_WINDOW_SEC = 600
+
+# Attempts per document before bulk_add gives up on it
+BULK_MAX_ATTEMPTS = 10
+
+# Retry policy for batch commits hitting contention or transient backend errors,
+# shared with AsyncFirebaseService
+COMMIT_RETRY_PARAMS = dict(
+    predicate=if_exception_type(
+        google_exceptions.Aborted,
+        google_exceptions.DeadlineExceeded,
+        google_exceptions.ServiceUnavailable,
+    ),
+    initial=0.5,
+    maximum=10.0,
+    multiplier=2.0,
+    timeout=60.0,
+)
+_COMMIT_RETRY = Retry(**COMMIT_RETRY_PARAMS)
+
+def apply_filters(query, filters: Optional[List[FieldFilter]]):
+    """
+    Apply filters to a query as a single composite filter.
+
+    :param query: Collection reference or query to filter.
+    :param filters: Optional list of filters, combined with AND.
+    :return: The filtered query.
+    """
+    if not filters:
+        return query
+    if len(filters) == 1:
+        return query.where(filter=filters[0])
+    return query.where(filter=And(filters=filters))
+
 # Firebase service implementation
 class FirebaseService(FirebaseServiceInterface):
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        max_workers: int = 10,
+        pool_size: int = 4,
+        cached_models: Optional[Iterable[Type[FirebaseObject]]] = None,
+        cache_ttl: float = 60,
+        cache_maxsize: int = 10_000,
+        prefetch_models: Optional[Iterable[Type[FirebaseObject]]] = None,
+        prefetch_refresh_sec: float = 300
+    ):
         self.db = None
-        self.__initialize(api_key=api_key)
+        self._clients = []
+        self._rr = None
+        self.max_workers = max_workers  # Max concurrent batch commits
+
+        # Read-through cache of parsed documents keyed by (collection, doc_id),
+        # used only for the (rarely changing) models listed in cached_models
+        self._cached_collections = {model_class.COLLECTION for model_class in cached_models or ()}
+        self._doc_cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        self._cache_lock = RLock()
+        # Invalidation sequence number, and the last one per (collection, doc_id)
+        self._cache_seq = 0
+        self._invalidated = TTLCache(maxsize=cache_maxsize, ttl=_INVALIDATION_WINDOW_SEC)
+
+        # In-memory snapshots of whole collections, refreshed by background threads
+        self._prefetch_collections: Dict[str, Dict[str, FirebaseObject]] = {}
+        self._prefetch_stop = Event()
 
-    def __initialize(self, api_key: str):
+        self.__initialize(api_key=api_key, pool_size=pool_size)
+
+        for model_class in prefetch_models or ():
+            self.prefetch(model_class, refresh_sec=prefetch_refresh_sec)
+
+    def __initialize(self, api_key: str, pool_size: int):
         """
         Initialize Firebase Admin SDK with the service account key from the environment.
         """
@@ -24,8 +104,101 @@ class FirebaseService(FirebaseServiceInterface):
             cred = credentials.Certificate(cred_dict)
             firebase_admin.initialize_app(cred)
 
-        # Initialize Firestore client
-        self.db = firestore.client()
+        # Initialize Firestore clients; each one owns a separate gRPC channel,
+        # which spreads concurrent requests past a single channel's stream limit
+        app = firebase_admin.get_app()
+        self._clients = [firestore.client()] + [
+            google_firestore.Client(credentials=app.credential.get_credential(), project=app.project_id)
+            for _ in range(pool_size - 1)
+        ]
+        self._rr = itertools.cycle(self._clients)
+        self.db = self._clients[0]  # Stable client for external callers
+
+    def _next_client(self):
+        """
+        Firestore client to use for the next operation, picked round-robin from the pool.
+        """
+        return next(self._rr)
+
+    def prefetch(self, model_class: Type[FirebaseObject], refresh_sec: float = 300) -> None:
+        """
+        Keep an in-memory snapshot of a whole (small, rarely changing) collection,
+        reloaded in a background thread every `refresh_sec` seconds until `close_db`.
+
+        :param model_class: The class corresponding to the collection to prefetch.
+        :param refresh_sec: Interval between snapshot reloads in seconds.
+        """
+        def refresh_loop():
+            while True:
+                try:
+                    since = self._cache_mark()
+                    snapshot = {obj.id: obj for obj in self.fetch_all(model_class)}
+                    with self._cache_lock:
+                        # Skip documents written while the collection was being read
+                        for doc_id in [i for i in snapshot if self._invalidated_since(model_class.COLLECTION, i, since)]:
+                            del snapshot[doc_id]
+                        self._prefetch_collections[model_class.COLLECTION] = snapshot
+                except FirebaseServiceException as e:
+                    logger.warning("prefetch of %s failed: %s", model_class.COLLECTION, e)
+                if self._prefetch_stop.wait(refresh_sec):
+                    return
+
+        Thread(target=refresh_loop, name=f"prefetch-{model_class.COLLECTION}", daemon=True).start()
+
+    def _cache_get(self, model_class: Type[FirebaseObject], doc_id: str) -> Optional[FirebaseObject]:
+        """
+        Return a deep copy of a prefetched or cached document, or None on a cache miss.
+        """
+        collection_name = model_class.COLLECTION
+        obj = self._prefetch_collections.get(collection_name, {}).get(doc_id)
+        if obj is not None:
+            return obj.model_copy(deep=True)
+
+        if collection_name not in self._cached_collections:
+            return None
+        with self._cache_lock:
+            obj = self._doc_cache.get((collection_name, doc_id))
+        return obj.model_copy(deep=True) if obj is not None else None
+
+    def _cache_mark(self) -> int:
+        """
+        Return the current invalidation sequence number; take it before a read
+        and pass it to `_cache_put` with the read's results.
+        """
+        with self._cache_lock:
+            return self._cache_seq
+
+    def _invalidated_since(self, collection_name: str, doc_id: str, since: int) -> bool:
+        """
+        Whether the document was invalidated after `since`. Call with `_cache_lock` held.
+        """
+        return self._invalidated.get((collection_name, doc_id), 0) > since
+
+    def _cache_put(self, obj: FirebaseObject, since: int) -> None:
+        """
+        Store a deep copy of a fetched document if its model is cacheable and
+        it has not been written since the read started (`since` from `_cache_mark`).
+        """
+        collection_name = obj.COLLECTION
+        if collection_name not in self._cached_collections:
+            return
+        with self._cache_lock:
+            if not self._invalidated_since(collection_name, obj.id, since):
+                self._doc_cache[(collection_name, obj.id)] = obj.model_copy(deep=True)
+
+    def _cache_invalidate(self, collection_name: str, doc_ids: List[str]) -> None:
+        """
+        Drop written or deleted documents from the prefetched snapshots and the cache,
+        and remember the invalidation so in-flight reads cannot put them back.
+        """
+        with self._cache_lock:
+            self._cache_seq += 1
+            snapshot = self._prefetch_collections.get(collection_name)
+            for doc_id in doc_ids:
+                self._invalidated[(collection_name, doc_id)] = self._cache_seq
+                self._doc_cache.pop((collection_name, doc_id), None)
+                if snapshot is not None:
+                    snapshot.pop(doc_id, None)
 
     def add(self, obj: FirebaseObject) -> str:
         """
@@ -38,14 +211,14 @@ class FirebaseService(FirebaseServiceInterface):
 
         try:
             # Access the specified collection
-            collection_ref = self.db.collection(obj.collection_name())
+            collection_ref = self._next_client().collection(obj.COLLECTION)
             # Add the object to Firestore
-            _, doc_ref = collection_ref.add(obj.model_dump(exclude_unset=True))
+            _, doc_ref = collection_ref.add(obj.dump_for_write())
             obj.id = doc_ref.id
             return obj  # Return the document with ID
         except Exception as e:
             # Raise a custom exception if there's an error
-            raise FirebaseServiceException(f"Failed to add document to {obj.collection_name()}: {str(e)}")
+            raise FirebaseServiceException(f"Failed to add document to {obj.COLLECTION}: {str(e)}")
         
     def add_with_doc_id(self, doc_id: str, obj: FirebaseObject) -> FirebaseObject:
         """
@@ -58,13 +231,14 @@ class FirebaseService(FirebaseServiceInterface):
 
         try:
             # Access the specified collection
-            collection_ref = self.db.collection(obj.collection_name()).document(doc_id)
+            collection_ref = self._next_client().collection(obj.COLLECTION).document(doc_id)
             # Add the object with specific ID to Firestore
-            collection_ref.set(obj.model_dump(exclude_unset=True))
+            collection_ref.set(obj.dump_for_write())
+            self._cache_invalidate(obj.COLLECTION, [doc_id])
             return obj  # Return the document
         except Exception as e:
             # Raise a custom exception if there's an error
-            raise FirebaseServiceException(f"Failed to add document to {obj.collection_name()}: {str(e)}")
+            raise FirebaseServiceException(f"Failed to add document to {obj.COLLECTION}: {str(e)}")
         
     def delete(self, model_class: Type[FirebaseObject], document_id: str):
         """
@@ -75,49 +249,68 @@ class FirebaseService(FirebaseServiceInterface):
         """
         try:
             # Access the specified collection
-            collection_ref = self.db.collection(model_class.collection_name())
+            collection_ref = self._next_client().collection(model_class.COLLECTION)
 
             # Get a reference to the document
             doc_ref = collection_ref.document(document_id)
 
             # Delete the document
             doc_ref.delete()
+            self._cache_invalidate(model_class.COLLECTION, [document_id])
         except Exception as e:
             raise FirebaseServiceException(f"Failed to delete document: {str(e)}")
         
-    def fetch_all(self, model_class: Type[FirebaseObject], filters: Optional[List[FieldFilter]] = None) -> List[FirebaseObject]:
+    def iter_all(
+        self,
+        model_class: Type[FirebaseObject],
+        filters: Optional[List[FieldFilter]] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[FirebaseObject]:
         """
-        Fetch all documents from a specified Firestore collection and convert them into objects of type `model_class`.
+        Stream documents from a specified Firestore collection as objects of type `model_class`,
+        parsing each one as it arrives instead of waiting for the whole result set.
 
-        :param collection_name: Name of the Firestore collection to fetch data from.
         :param model_class: The class to which the documents should be mapped (e.g., User, Product).
-        :return: A list of objects of type `model_class`.
+        :param filters: Optional list of filters to apply to the query.
+        :param limit: Optional maximum number of documents to fetch (applied on the server).
+        :return: An iterator over objects of type `model_class`.
         """
         try:
+            since = self._cache_mark()
+
             # Get all documents from the specified Firestore collection
-            collection_ref = self.db.collection(model_class.collection_name())
+            query = self._next_client().collection(model_class.COLLECTION)
 
             # Apply the filter if provided
-            if filters:
-                filtered = collection_ref
-                for filter in filters:
-                    filtered = filtered.where(filter=filter)
-                documents = filtered.stream()
-            else:
-                documents = collection_ref.stream()
-
-            objects = []
-            for doc in documents:
-                # Convert Firestore document to model instance
-                data = doc.to_dict()
-                data["id"] = doc.id  # Include the document ID
-                obj = model_class(**data)  # Create an instance of the model class using the data
-                objects.append(obj)
+            query = apply_filters(query, filters)
 
-            return objects
+            if limit is not None:
+                query = query.limit(limit)
+
+            for doc in query.stream():
+                # Convert Firestore document to model instance
+                obj = model_class.model_validate({**doc.to_dict(), "id": doc.id})
+                self._cache_put(obj, since)
+                yield obj
 
         except Exception as e:
-            raise FirebaseServiceException(f"Error fetching documents from {model_class.collection_name()}: {str(e)}")
+            raise FirebaseServiceException(f"Error fetching documents from {model_class.COLLECTION}: {str(e)}")
+
+    def fetch_all(
+        self,
+        model_class: Type[FirebaseObject],
+        filters: Optional[List[FieldFilter]] = None,
+        limit: Optional[int] = None
+    ) -> List[FirebaseObject]:
+        """
+        Fetch all documents from a specified Firestore collection and convert them into objects of type `model_class`.
+
+        :param model_class: The class to which the documents should be mapped (e.g., User, Product).
+        :param filters: Optional list of filters to apply to the query.
+        :param limit: Optional maximum number of documents to fetch (applied on the server).
+        :return: A list of objects of type `model_class`.
+        """
+        return list(self.iter_all(model_class, filters=filters, limit=limit))
 
     def fetch_by_id(self, model_class: Type[FirebaseObject], doc_id: str) -> Optional[FirebaseObject]:
         """
@@ -129,9 +322,15 @@ class FirebaseService(FirebaseServiceInterface):
         :param model_class: The class to which the document should be mapped (e.g., User).
         :return: An object of type `model_class`.
         """
+        cached = self._cache_get(model_class, doc_id)
+        if cached is not None:
+            return cached
+
         try:
+            since = self._cache_mark()
+
             # Access the document by ID
-            doc_ref = self.db.collection(model_class.collection_name()).document(doc_id)
+            doc_ref = self._next_client().collection(model_class.COLLECTION).document(doc_id)
             doc = doc_ref.get()  # Get the document
             
             if not doc.exists: # Document does not exist
@@ -142,10 +341,55 @@ class FirebaseService(FirebaseServiceInterface):
             data["id"] = doc.id  # Include the Firestore document ID in the data
             
             # Create the model instance from the data
-            return model_class(**data)  # Convert to the model (e.g., User)
+            obj = model_class.model_validate(data)  # Convert to the model (e.g., User)
+            self._cache_put(obj, since)
+            return obj
         except Exception as e:
-            raise FirebaseServiceException(f"Error fetching document from {model_class.collection_name()}: {e}")
+            raise FirebaseServiceException(f"Error fetching document from {model_class.COLLECTION}: {e}")
         
+    def fetch_many(self, model_class: Type[FirebaseObject], doc_ids: List[str]) -> List[Optional[FirebaseObject]]:
+        """
+        Fetch multiple documents by their IDs in a single round-trip
+        and convert them into objects of the specified model class.
+
+        :param model_class: The class to which the documents should be mapped (e.g., User).
+        :param doc_ids: Document IDs of the Firestore documents to retrieve.
+        :return: A list of objects of type `model_class` in the order of `doc_ids`,
+                 with None for documents that do not exist.
+        """
+        if not doc_ids:
+            return []
+
+        since = self._cache_mark()
+        found = {}
+        for doc_id in doc_ids:
+            cached = self._cache_get(model_class, doc_id)
+            if cached is not None:
+                found[doc_id] = cached
+
+        missing = [doc_id for doc_id in dict.fromkeys(doc_ids) if doc_id not in found]
+        if not missing:
+            return [found[doc_id] for doc_id in doc_ids]
+
+        try:
+            db = self._next_client()  # Use one client for the whole operation
+            collection_ref = db.collection(model_class.COLLECTION)
+            refs = [collection_ref.document(doc_id) for doc_id in missing]
+
+            # get_all streams the snapshots back in arbitrary order
+            for doc in db.get_all(refs):
+                if not doc.exists:
+                    continue
+                data = doc.to_dict()
+                data["id"] = doc.id  # Include the Firestore document ID in the data
+                obj = model_class.model_validate(data)
+                self._cache_put(obj, since)
+                found[doc.id] = obj
+
+            return [found.get(doc_id) for doc_id in doc_ids]
+        except Exception as e:
+            raise FirebaseServiceException(f"Error fetching documents from {model_class.COLLECTION}: {e}")
+
     def fetch_one(self, model_class: Type[FirebaseObject], filters: Optional[List[FieldFilter]]) -> Optional[FirebaseObject]:
         """
         Fetch a single document from the specified Firestore collection and convert it into an object of type `model_class`.
@@ -155,14 +399,27 @@ class FirebaseService(FirebaseServiceInterface):
         :return: An object of type `model_class` or None if no document matches the query.
         """
 
-        objects = self.fetch_all(model_class=model_class, filters=filters)
-        if not objects:
+        since = self._cache_mark()
+        try:
+            query = apply_filters(self._next_client().collection(model_class.COLLECTION), filters)
+
+            # Two documents are enough to detect an ambiguous match
+            documents = list(query.limit(2).stream())
+        except Exception as e:
+            raise FirebaseServiceException(f"Error fetching documents from {model_class.COLLECTION}: {str(e)}")
+
+        if not documents:
             return None
         
-        if len(objects) != 1:
-            raise FirebaseServiceException(f"Expected one document, but found {len(objects)} in {model_class.collection_name()}.")
+        if len(documents) != 1:
+            raise FirebaseServiceException(f"Expected one document, but found more in {model_class.COLLECTION}.")
         
-        return objects[0]  # Return the single object found
+        # Parse only the single matching document
+        data = documents[0].to_dict()
+        data["id"] = documents[0].id  # Include the document ID
+        obj = model_class.model_validate(data)
+        self._cache_put(obj, since)
+        return obj  # Return the single object found
 
     def update(self, id: str, obj: FirebaseObject) -> FirebaseObject:
         """
@@ -175,13 +432,14 @@ class FirebaseService(FirebaseServiceInterface):
         """
         try:
             # Get document reference by ID
-            doc_ref = self.db.collection(obj.collection_name()).document(id)
+            doc_ref = self._next_client().collection(obj.COLLECTION).document(id)
 
             # Convert the Pydantic model to a dictionary
-            data = obj.model_dump(exclude_unset=True)  # Exclude unset fields
+            data = obj.dump_for_write()  # Exclude unset fields
 
             # Update the document in Firestore
             doc_ref.set(data, merge=True)  # merge=True will update only the fields provided, not the entire document
+            self._cache_invalidate(obj.COLLECTION, [id])
 
             data["id"] = id
             return data  # Return the document ID of the updated object
@@ -204,34 +462,62 @@ class FirebaseService(FirebaseServiceInterface):
         """
         
         try:
-            parent_ref = self.db.collection(parent_collection.collection_name()).document(parent_id)
-            subcol_ref = parent_ref.collection(obj.collection_name())
-            _, doc_ref = subcol_ref.add(obj.model_dump(exclude_unset=True))
+            parent_ref = self._next_client().collection(parent_collection.COLLECTION).document(parent_id)
+            subcol_ref = parent_ref.collection(obj.COLLECTION)
+            _, doc_ref = subcol_ref.add(obj.dump_for_write())
             return doc_ref.id
         except Exception as e:
             raise FirebaseServiceException(
-                f"Adding subcollection failure {obj.collection_name()} "
-                f"document {parent_collection.collection_name()}/{parent_id}: {e}"
+                f"Adding subcollection failure {obj.COLLECTION} "
+                f"document {parent_collection.COLLECTION}/{parent_id}: {e}"
             )
         
         
+    def _commit_batches(self, batches: List[WriteBatch]) -> None:
+        """
+        Commit write batches concurrently, retrying transient failures.
+
+        :param batches: List of WriteBatch instances to commit.
+        :return: None.
+        """
+        if not batches:
+            return
+        if len(batches) == 1:
+            batches[0].commit(retry=_COMMIT_RETRY)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+            futures = [executor.submit(batch.commit, retry=_COMMIT_RETRY) for batch in batches]
+            for future in futures:
+                future.result()  # Re-raise the first failure, if any
+
     def batch_add(self, objs: List[FirebaseObject]) -> List[FirebaseObject]:
         """
         Add multiple objects to Firestore in a batch operation.
+        Objects are split into chunks of MAX_BATCH_SIZE that are committed in parallel,
+        so a failure may leave earlier chunks written.
         
         :param objs: List of FirebaseObject instances to add.
         :return: List of FirebaseObject instances with assigned document IDs.
         """
         try:
-            batch = self.db.batch()
+            db = self._next_client()  # Use one client for the whole operation
+            batches = []
             updated_objs = []
-            for obj in objs:
-                collection_ref = self.db.collection(obj.collection_name())
-                doc_ref = collection_ref.document()  # auto-generated ID
-                batch.set(doc_ref, obj.model_dump(exclude_unset=True))
-                obj.id = doc_ref.id  # Assign the generated ID to the object
-                updated_objs.append(obj)
-            batch.commit()
+            collection_refs = {}  # Reuse one CollectionReference per collection
+            for i in range(0, len(objs), MAX_BATCH_SIZE):
+                batch = db.batch()
+                for obj in objs[i:i + MAX_BATCH_SIZE]:
+                    collection_name = obj.COLLECTION
+                    collection_ref = collection_refs.get(collection_name)
+                    if collection_ref is None:
+                        collection_ref = collection_refs[collection_name] = db.collection(collection_name)
+                    doc_ref = collection_ref.document()  # auto-generated ID
+                    batch.set(doc_ref, obj.dump_for_write())
+                    obj.id = doc_ref.id  # Assign the generated ID to the object
+                    updated_objs.append(obj)
+                batches.append(batch)
+            self._commit_batches(batches)
             return updated_objs  # Return the list of objects with assigned IDs
         except Exception as e:
             raise FirebaseServiceException(f"Batch add failed: {str(e)}")
@@ -240,20 +526,32 @@ class FirebaseService(FirebaseServiceInterface):
         """
         Update multiple documents in Firestore using a batch operation.
         Each object must have an 'id' field set.
+        Objects are split into chunks of MAX_BATCH_SIZE that are committed in parallel.
 
         :param objs: List of FirebaseObject instances to update.
         :return: List of updated FirebaseObject instances.
         """
         try:
-            batch = self.db.batch()
+            db = self._next_client()  # Use one client for the whole operation
+            batches = []
             updated_objs = []
-            for obj in objs:
-                if not obj.id:
-                    raise FirebaseServiceException("Each object must have an ID for batch update.")
-                doc_ref = self.db.collection(obj.collection_name()).document(obj.id)
-                batch.set(doc_ref, obj.model_dump(exclude_unset=True), merge=True)
-                updated_objs.append(obj)  # Add the updated object to the list
-            batch.commit()
+            collection_refs = {}  # Reuse one CollectionReference per collection
+            for i in range(0, len(objs), MAX_BATCH_SIZE):
+                batch = db.batch()
+                for obj in objs[i:i + MAX_BATCH_SIZE]:
+                    if not obj.id:
+                        raise FirebaseServiceException("Each object must have an ID for batch update.")
+                    collection_name = obj.COLLECTION
+                    collection_ref = collection_refs.get(collection_name)
+                    if collection_ref is None:
+                        collection_ref = collection_refs[collection_name] = db.collection(collection_name)
+                    doc_ref = collection_ref.document(obj.id)
+                    batch.set(doc_ref, obj.dump_for_write(), merge=True)
+                    updated_objs.append(obj)  # Add the updated object to the list
+                batches.append(batch)
+            self._commit_batches(batches)
+            for collection_name in collection_refs:
+                self._cache_invalidate(collection_name, [obj.id for obj in updated_objs if obj.COLLECTION == collection_name])
             return updated_objs  # Return the list of updated objects
         except Exception as e:
             raise FirebaseServiceException(f"Batch update failed: {str(e)}")
@@ -261,32 +559,79 @@ class FirebaseService(FirebaseServiceInterface):
     def batch_delete(self, model_class: Type[FirebaseObject], doc_ids: List[str]) -> None:
         """
         Delete multiple documents in Firestore using a batch operation.
+        Document IDs are split into chunks of MAX_BATCH_SIZE that are committed in parallel.
         
         :param model_class: The class corresponding to the collection where documents are located.
         :param doc_ids: List of document IDs to be deleted.
         :return: None.
         """
         try:
-            # Start a batch operation
-            batch = self.db.batch()
+            db = self._next_client()  # Use one client for the whole operation
+            batches = []
+            collection_ref = db.collection(model_class.COLLECTION)
+            for i in range(0, len(doc_ids), MAX_BATCH_SIZE):
+                # Start a batch operation
+                batch = db.batch()
+                for doc_id in doc_ids[i:i + MAX_BATCH_SIZE]:
+                    # Get a reference to the document
+                    doc_ref = collection_ref.document(doc_id)
+                    # Delete the document by adding it to the batch
+                    batch.delete(doc_ref)
+                batches.append(batch)
             
-            for doc_id in doc_ids:
-                # Get a reference to the document
-                doc_ref = self.db.collection(model_class.collection_name()).document(doc_id)
-                # Delete the document by adding it to the batch
-                batch.delete(doc_ref)
-            
-            # Commit the batch operation
-            batch.commit()
-            print(f"Successfully deleted {len(doc_ids)} documents.")
+            # Commit the batch operations
+            self._commit_batches(batches)
+            self._cache_invalidate(model_class.COLLECTION, doc_ids)
+            logger.debug("batch_delete: %d docs", len(doc_ids))
 
         except Exception as e:
             raise FirebaseServiceException(f"Batch delete failed: {str(e)}")
         
+    def bulk_add(self, objs: List[FirebaseObject]) -> List[FirebaseObject]:
+        """
+        Add a large number of objects using Firestore's BulkWriter, which handles
+        parallel dispatch, throttling and retries itself. Prefer it over `batch_add`
+        for seed/import workloads; writes are not atomic and may land in any order.
+
+        :param objs: List of FirebaseObject instances to add.
+        :return: List of FirebaseObject instances with assigned document IDs.
+        """
+        failures = []
+
+        def on_write_error(error, _bulk_writer) -> bool:
+            if error.attempts < BULK_MAX_ATTEMPTS:
+                return True  # Retry the write
+            failures.append(error)
+            return False
+
+        try:
+            db = self._next_client()
+            bulk_writer = db.bulk_writer()
+            bulk_writer.on_write_error(on_write_error)
+            collection_refs = {}  # Reuse one CollectionReference per collection
+            for obj in objs:
+                collection_ref = collection_refs.get(obj.COLLECTION)
+                if collection_ref is None:
+                    collection_ref = collection_refs[obj.COLLECTION] = db.collection(obj.COLLECTION)
+                doc_ref = collection_ref.document()  # auto-generated ID
+                bulk_writer.create(doc_ref, obj.dump_for_write())
+                obj.id = doc_ref.id  # Assign the generated ID to the object
+            bulk_writer.close()  # Flush pending writes and wait for them to finish
+        except Exception as e:
+            raise FirebaseServiceException(f"Bulk add failed: {str(e)}")
+
+        if failures:
+            raise FirebaseServiceException(
+                f"Bulk add failed for {len(failures)} of {len(objs)} documents: {failures[0].message}"
+            )
+        return objs
+
     def close_db(self):
         """
         Close the Firestore database connection.
         """
-        self.db.close()
+        self._prefetch_stop.set()
+        for client in self._clients:
+            client.close()
 
     
\ No newline at end of file
@@ -5,6 +5,9 @@ setup(
     version="0.1.3",
     packages=find_packages(),  # найдёт папку common/common
     install_requires=[         # List of dependencies
-        'firebase-admin',      # Add firebase-admin as a required dependency
+        'firebase-admin>=6.0',            # firestore_async client
+        'google-cloud-firestore>=2.11',   # And/Or composite filters
+        'cachetools',                     # TTL cache for FirebaseService reads
+        'pydantic>=2.5',                  # Discriminator/Tag for Gift.payload
     ],
 )